@@ -8,7 +8,6 @@ __since__ = '07/02/2023'
 
 
 from typing import TypeVar, Generic
-from data_structures.referential_array import ArrayR
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -41,7 +40,10 @@ class LinearProbeTable(Generic[K, V]):
         if sizes is not None:
             self.TABLE_SIZES = sizes
         self.size_index = 0
-        self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
+        # Two parallel plain lists rather than an ArrayR of (key, value) tuples: probing only
+        # reads _keys, and an insert stores two references instead of allocating a tuple.
+        self._keys: list[K | None] = [None] * self.TABLE_SIZES[self.size_index]
+        self._values: list[V | None] = [None] * self.TABLE_SIZES[self.size_index]
         self.count = 0
 
     def hash(self, key: K) -> int:
@@ -53,14 +55,18 @@ class LinearProbeTable(Generic[K, V]):
 
         value = 0
         a = 31415
+        # Locals instead of the table_size property and HASH_BASE on every character.
+        table_size = len(self._keys)
+        a_modulus = table_size - 1
+        base = self.HASH_BASE
         for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
+            value = (ord(char) + a * value) % table_size
+            a = a * base % a_modulus
         return value
 
     @property
     def table_size(self) -> int:
-        return len(self.array)
+        return len(self._keys)
 
     def __len__(self) -> int:
         """
@@ -80,18 +86,24 @@ class LinearProbeTable(Generic[K, V]):
         # Initial position
         position = self.hash(key)
 
-        for _ in range(self.table_size):
-            if self.array[position] is None:
+        keys = self._keys
+        size = len(keys)
+
+        for _ in range(size):
+            current_key = keys[position]
+            if current_key is None:
                 # Empty spot. Am I upserting or retrieving?
                 if is_insert:
                     return position
                 else:
                     raise KeyError(key)
-            elif self.array[position][0] == key:
+            elif current_key == key:
                 return position
             else:
                 # Taken by something else. Time to linear probe.
-                position = (position + 1) % self.table_size
+                position += 1
+                if position == size:
+                    position = 0
 
         if is_insert:
             raise FullError("Table is full!")
@@ -104,11 +116,7 @@ class LinearProbeTable(Generic[K, V]):
 
         :complexity: O(N) where N is self.table_size.
         """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][0])
-        return res
+        return [key for key in self._keys if key is not None]
 
     def values(self) -> list[V]:
         """
@@ -116,11 +124,7 @@ class LinearProbeTable(Generic[K, V]):
 
         :complexity: O(N) where N is self.table_size.
         """
-        res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][1])
-        return res
+        return [value for key, value in zip(self._keys, self._values) if key is not None]
 
     def __contains__(self, key: K) -> bool:
         """
@@ -143,7 +147,7 @@ class LinearProbeTable(Generic[K, V]):
         :raises KeyError: when the key doesn't exist.
         """
         position = self._linear_probe(key, False)
-        return self.array[position][1]
+        return self._values[position]
 
     def __setitem__(self, key: K, data: V) -> None:
         """
@@ -155,10 +159,11 @@ class LinearProbeTable(Generic[K, V]):
 
         position = self._linear_probe(key, True)
 
-        if self.array[position] is None:
+        if self._keys[position] is None:
             self.count += 1
 
-        self.array[position] = (key, data)
+        self._keys[position] = key
+        self._values[position] = data
 
         if len(self) > self.table_size / 2:
             self._rehash()
@@ -172,17 +177,23 @@ class LinearProbeTable(Generic[K, V]):
         :raises KeyError: when the key doesn't exist.
         """
         position = self._linear_probe(key, False)
+        keys = self._keys
+        values = self._values
         # Remove the element
-        self.array[position] = None
+        keys[position] = None
+        values[position] = None
         self.count -= 1
         # Start moving over the cluster
         position = (position + 1) % self.table_size
-        while self.array[position] is not None:
-            key2, value = self.array[position]
-            self.array[position] = None
+        while keys[position] is not None:
+            key2 = keys[position]
+            value = values[position]
+            keys[position] = None
+            values[position] = None
             # Reinsert.
             newpos = self._linear_probe(key2, True)
-            self.array[newpos] = (key2, value)
+            keys[newpos] = key2
+            values[newpos] = value
             position = (position + 1) % self.table_size
 
     def is_empty(self) -> bool:
@@ -199,16 +210,17 @@ class LinearProbeTable(Generic[K, V]):
         :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
         Where N is len(self)
         """
-        old_array = self.array
+        old_keys = self._keys
+        old_values = self._values
         self.size_index += 1
         if self.size_index >= len(self.TABLE_SIZES):
             # Cannot be resized further.
             return
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
+        self._keys = [None] * self.TABLE_SIZES[self.size_index]
+        self._values = [None] * self.TABLE_SIZES[self.size_index]
         self.count = 0
-        for item in old_array:
-            if item is not None:
-                key, value = item
+        for key, value in zip(old_keys, old_values):
+            if key is not None:
                 self[key] = value
 
     def __str__(self) -> str:
@@ -218,8 +230,7 @@ class LinearProbeTable(Generic[K, V]):
         :complexity: O(N * (str(key) + str(value))) where N is the table size
         """
         result = ""
-        for item in self.array:
-            if item is not None:
-                (key, value) = item
+        for key, value in zip(self._keys, self._values):
+            if key is not None:
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
\ No newline at end of file
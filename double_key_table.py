@@ -1,14 +1,64 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar, Iterator
+from bisect import bisect_right
+from functools import partial
+from itertools import chain
+from operator import is_not
+from typing import Generic, TypeVar, Iterable, Iterator
 from data_structures.hash_table import LinearProbeTable, FullError
-from data_structures.referential_array import ArrayR
 
 K1 = TypeVar('K1')
 K2 = TypeVar('K2')
 V = TypeVar('V')
 
 
+class _InnerTable(LinearProbeTable[K2, V]):
+    """
+    Inner table of a DoubleKeyTable.
+
+    Hashes keys through the owning table's `hash2`, so overriding `hash2` on the
+    DoubleKeyTable still controls the inner layout, without a closure per table.
+    """
+
+    def __init__(self, owner: DoubleKeyTable[K1, K2, V], sizes: list[int] | None = None) -> None:
+        super().__init__(sizes)
+        self.owner = owner
+
+    def hash(self, key: K2) -> int:
+        """
+        Hash a key using the owning table's `hash2`.
+
+        :complexity: See DoubleKeyTable.hash2.
+        """
+        return self.owner.hash2(key, self)
+
+    def probe_status(self, key: K2) -> tuple[int, bool]:
+        """
+        Find the position for this key with a single probe, reporting whether it is already present.
+
+        :returns: (position, found) where found is False if position is the empty slot the key would take.
+        :raises FullError: When the key is absent and the table has no empty slot.
+        :complexity best: O(hash(key)) first position is empty or holds the key.
+        :complexity worst: O(hash(key) + N*comp(K)) when we've searched the entire table
+                        where N is the tablesize
+        """
+        position = self.hash(key)
+        keys = self._keys
+        size = len(keys)
+
+        for _ in range(size):
+            current_key = keys[position]
+            if current_key is None:
+                return position, False
+            if current_key == key:
+                return position, True
+            position += 1
+            if position == size:
+                position = 0
+
+        raise FullError("Table is full!")
+
+
 class DoubleKeyTable(Generic[K1, K2, V]):
     """
     Double Hash Table stores data in a two-level hash table. The first key `K1` hashes
@@ -17,15 +67,18 @@ class DoubleKeyTable(Generic[K1, K2, V]):
 
     - The outer table and inner tables are implemented using open addressing with linear probing.
     - The outer table contains keys of type `K1` and values which are instances of the inner tables (LinearProbeTable).
+      These are stored as two parallel arrays, `_keys` and `_subtables`, so probing only touches the keys.
     - The inner tables contain keys of type `K2` and values of type `V`.
 
     Type Arguments:
-    - K1:   1st Key Type. In most cases should be string.
-            Otherwise `hash1` should be overwritten.
-    - K2:   2nd Key Type. In most cases should be string.
-            Otherwise `hash2` should be overwritten.
+    - K1:   1st Key Type. Any hashable type except None, in most cases string.
+            `hash1` can be overwritten to control the outer layout.
+    - K2:   2nd Key Type. Any hashable type except None, in most cases string.
+            `hash2` can be overwritten to control the inner layout.
     - V:    Value Type.
 
+    None marks an empty slot in both the outer and inner key arrays, so it cannot be used as a key.
+
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
@@ -33,18 +86,24 @@ class DoubleKeyTable(Generic[K1, K2, V]):
     TABLE_SIZES = [5, 13, 29, 53, 97, 193, 389, 769, 1543, 3079, 6151, 12289, 24593, 49157, 98317, 196613, 393241,
                    786433, 1572869]
 
-    HASH_BASE = 31
+    # Fixed attributes live in slots. `__dict__` is kept so hash1/hash2 can still be
+    # overridden per instance, as the tests and main.py do.
+    __slots__ = ('external_table_sizes', 'internal_table_sizes', 'size_index', '_keys', '_subtables',
+                 'external_table_length', '_item_count', '__dict__')
 
-    def __init__(self, sizes: list | None = None, internal_sizes: list | None = None) -> None:
+    def __init__(self, sizes: list[int] | None = None, internal_sizes: list[int] | None = None,
+                 expected_items: int | None = None) -> None:
         """
         Initialise the DoubleKeyTable with given sizes or defaults.
 
         Args:
         - sizes (List[int], optional): Sizes for the external tables. Defaults to predefined TABLE_SIZES.
         - internal_sizes (List[int], optional): Sizes for the internal tables. Defaults to predefined TABLE_SIZES.
+        - expected_items (int, optional): Number of top-level keys expected. If given, the outer table starts
+          at the smallest size that holds them without rehashing.
 
         Complexity:
-        - Best and Worst: O(n), where n is the initial size of the outer table due to the initialisation of ArrayR.
+        - Best and Worst: O(n), where n is the initial size of the outer table due to the initialisation of the outer arrays.
           All other operations are typically O(1) average time.
         """
 
@@ -58,40 +117,38 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         else:
             self.internal_table_sizes = self.TABLE_SIZES
 
-        self.size_index = 0
+        if expected_items is not None:
+            self.size_index = self._size_index_for(expected_items)
+        else:
+            self.size_index = 0
 
-        self.external_table_array = ArrayR(self.external_table_sizes[self.size_index])
+        # Plain lists rather than ArrayR: indexing a list is a C-level operation, whereas
+        # ArrayR goes through Python-level __getitem__/__setitem__ on every probe step.
+        self._keys: list[K1 | None] = [None] * self.external_table_sizes[self.size_index]
+        self._subtables: list[_InnerTable[K2, V] | None] = [None] * self.external_table_sizes[self.size_index]
 
+        # Number of occupied outer slots, used for the load factor.
         self.external_table_length = 0
-
+        # Number of (key1, key2) pairs stored, returned by __len__.
+        self._item_count = 0
 
     def hash1(self, key: K1) -> int:
         """
         Hash the 1st key for insert/retrieve/update into the hashtable.
 
-        :complexity: O(len(key))
-        """
+        Uses the builtin `hash`, which is implemented in C and cached on str objects.
 
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+        :complexity: O(len(key)) the first time a str is hashed, O(1) afterwards.
+        """
+        return hash(key) % self.table_size
 
     def hash2(self, key: K2, sub_table: LinearProbeTable[K2, V]) -> int:
         """
         Hash the 2nd key for insert/retrieve/update into the hashtable.
 
-        :complexity: O(len(key))
+        :complexity: O(len(key)) the first time a str is hashed, O(1) afterwards.
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % sub_table.table_size
-            a = a * self.HASH_BASE % (sub_table.table_size - 1)
-        return value
+        return hash(key) % sub_table.table_size
 
     def _linear_probe(self, key1: K1, key2: K2, is_insert: bool) -> tuple[int, int]:
         """
@@ -117,14 +174,17 @@ class DoubleKeyTable(Generic[K1, K2, V]):
 
         top_table_position = self.hash1(key1)
 
-        for _ in range(len(self.external_table_array)):
-            current_table_entry = self.external_table_array[top_table_position]
+        keys = self._keys
+        size = len(keys)
+
+        for _ in range(size):
+            current_key = keys[top_table_position]
 
-            if current_table_entry is None:
+            if current_key is None:
                 if is_insert:
-                    new_table = LinearProbeTable(self.internal_table_sizes)
-                    new_table.hash = lambda k, table=new_table: self.hash2(k, table)
-                    self.external_table_array[top_table_position] = (key1, new_table)
+                    new_table = _InnerTable(self, self.internal_table_sizes)
+                    keys[top_table_position] = key1
+                    self._subtables[top_table_position] = new_table
 
                     bottom_level_position = new_table._linear_probe(key2, True)
                     self.external_table_length += 1
@@ -132,32 +192,67 @@ class DoubleKeyTable(Generic[K1, K2, V]):
                 else:
                     raise KeyError(key1, key2)
 
-            elif current_table_entry[0] == key1:
-                bottom_level_table = current_table_entry[1]
+            elif current_key == key1:
+                # One inner probe tells us both where key2 is and whether it is there.
+                try:
+                    bottom_level_position, found = self._subtables[top_table_position].probe_status(key2)
+                except FullError:
+                    if is_insert:
+                        raise
+                    raise KeyError(key1, key2)
 
-                if key2 in bottom_level_table:
-                    bottom_level_position = bottom_level_table._linear_probe(key2, False)
+                if found or is_insert:
                     return top_table_position, bottom_level_position
-
-                else:
-                    if is_insert:
-                        bottom_level_position = bottom_level_table._linear_probe(key2, True)
-                        return top_table_position, bottom_level_position
-                    else:
-                        raise KeyError(key1, key2)
+                raise KeyError(key1, key2)
 
             else:
-                top_table_position = (top_table_position + 1) % self.table_size
+                # Wrap with a compare instead of a modulo on every probe step.
+                top_table_position += 1
+                if top_table_position == size:
+                    top_table_position = 0
 
         if is_insert:
             raise FullError("Table is full!")
         else:
             raise KeyError(key1, key2)
 
+    def _find_outer_slot(self, key1: K1) -> int:
+        """
+        Find the outer slot holding the given top-level key using linear probing, without inserting.
+
+        Args:
+        - key1 (K1): The top-level key.
+
+        Returns:
+        - int: The position of key1 in the outer table.
+
+        Raises:
+        - KeyError: If the top-level key is not in the table.
+
+        Complexity:
+        - Best: O(hash(key1)), if the key is at its hashed position.
+        - Worst: O(hash(key1) + n*comp(K1)), where n is the size of the outer table.
+        """
+        position = self.hash1(key1)
+
+        keys = self._keys
+        size = len(keys)
+
+        for _ in range(size):
+            current_key = keys[position]
+            if current_key is None:
+                break
+            if current_key == key1:
+                return position
+            position += 1
+            if position == size:
+                position = 0
+
+        raise KeyError(f"Top-level key '{key1}' not found in the table.")
+
     def iter_keys(self, key: K1 | None = None) -> Iterator[K1 | K2]:
         """
-        Generate an iterator (generator is a special type of iterator) over
-        keys in the table.
+        Return an iterator over keys in the table.
         key = None:
             Returns an iterator of all top-level keys in hash table
         key = k:
@@ -167,10 +262,13 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         - key (K1, optional): If specified, yields keys from the inner table corresponding to this key.
         Otherwise, yields all top-level keys.
 
-        Returns/Yields:
-        - A generator object of K1 | K2: Keys from the table.
+        Returns:
+        - An iterator of K1 | K2: Keys from the table.
+
+        Raises:
+        - KeyError: If key is given but is not a top-level key in the table.
 
-        Complexity for yielding and returning a generator:
+        Complexity for returning the iterator:
         Both best and worst case is O(1)
 
         Overall/Total Complexity for yielding all keys:
@@ -178,24 +276,11 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         - Worst: O(n*m), where n is the size of the outer table and m is the maximum size of an inner table.
         """
         if key is None:
-            # Yield top-level keys
-            for item in self.external_table_array:
-                if item is not None:
-                    yield item[0]
+            # filter and chain are C-level iterators, so no generator frame is resumed per key.
+            return filter(partial(is_not, None), self._keys)
         else:
-            # Yield keys from the internal hash table corresponding to the provided top-level key
-            key_hash = self.hash1(key)
-            key_position_outer_table = -1
-            for i in range(key_hash, len(self.external_table_array)):
-                if self.external_table_array[i] is not None and self.external_table_array[i][0] == key:
-                    key_position_outer_table = i
-                    break
-
-            if key_position_outer_table == -1:
-                raise KeyError(f"Top-level key '{key}' not found in the table.")
-            else:
-                for k in self.external_table_array[key_position_outer_table][1].keys():
-                    yield k
+            # Keys from the internal hash table corresponding to the provided top-level key
+            return iter(self._subtables[self._find_outer_slot(key)].keys())
 
     def keys(self, key: K1 | None = None) -> list[K1 | K2]:
         """
@@ -218,31 +303,13 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         and we are returning all the keys pairs and lots of probing is needed for the outer table.
         """
         if key is None:
-            top_level_keys = []
-
-            for i in range(self.table_size):
-                if self.external_table_array[i] is not None:
-                    top_level_keys.append(self.external_table_array[i][0])
-            return top_level_keys
+            return [k for k in self._keys if k is not None]
         else:
-            key_hash = self.hash1(key)
-            key_position_outer_table = -1
-            for i in range(key_hash, len(self.external_table_array)):
-                if self.external_table_array[i] is not None:
-                    if self.external_table_array[i][0] == key:
-                        key_position_outer_table = i
-                        break
-
-            if key_position_outer_table == -1:
-                raise KeyError(f"Top-level key '{key}' not found in the table.")
-            else:
-                bottom_level_keys = self.external_table_array[key_position_outer_table][1].keys()
-                return bottom_level_keys
+            return self._subtables[self._find_outer_slot(key)].keys()
 
     def iter_values(self, key: K1 | None = None) -> Iterator[V]:
         """
-        Generate an iterator (generator is a special type of iterator) over
-        values in the table.
+        Return an iterator over values in the table.
 
         key = None:
             Returns an iterator of all values in hash table
@@ -253,10 +320,13 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         - key (K1, optional): If specified, yields values from the inner table corresponding to this key.
         Otherwise, yields all values.
 
-        Returns/Yields:
-        - V: Values from the table.
+        Returns:
+        - An iterator of V: Values from the table.
+
+        Raises:
+        - KeyError: If key is given but is not a top-level key in the table.
 
-        Complexity for yielding and returning a generator:
+        Complexity for returning the iterator:
         Both best and worst case is O(1)
 
         Total complexity to yield all values:
@@ -266,25 +336,11 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         happens when we are returning all the values in the Double Key Hash Table.
         """
         if key is None:
-            # Yield all values from all internal hash tables
-            for item in self.external_table_array:
-                if item is not None:
-                    for v in item[1].values():
-                        yield v
+            # Values from all internal hash tables, one inner table at a time.
+            return chain.from_iterable(sub.values() for sub in self._subtables if sub is not None)
         else:
-            # Yield values from the internal hash table corresponding to the provided top-level key
-            key_hash = self.hash1(key)
-            key_position_outer_table = -1
-            for i in range(key_hash, len(self.external_table_array)):
-                if self.external_table_array[i] is not None and self.external_table_array[i][0] == key:
-                    key_position_outer_table = i
-                    break
-
-            if key_position_outer_table == -1:
-                raise KeyError(f"Top-level key '{key}' not found in the table.")
-            else:
-                for v in self.external_table_array[key_position_outer_table][1].values():
-                    yield v
+            # Values from the internal hash table corresponding to the provided top-level key
+            return iter(self._subtables[self._find_outer_slot(key)].values())
 
     def values(self, key: K1 | None = None) -> list[V]:
         """
@@ -306,27 +362,9 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         happens when we are returning all the values in the Double Key Hash Table.
         """
         if key is None:
-            all_values = []
-            for i in range(self.table_size):
-                if self.external_table_array[i] is not None:
-                    all_values += self.external_table_array[i][1].values()
-            return all_values
-
-
+            return list(chain.from_iterable(sub.values() for sub in self._subtables if sub is not None))
         else:
-            key_hash = self.hash1(key)
-            key_position_outer_table = -1
-            for i in range(key_hash, len(self.external_table_array)):
-                if self.external_table_array[i] is not None:
-                    if self.external_table_array[i][0] == key:
-                        key_position_outer_table = i
-                        break
-
-            if key_position_outer_table == -1:
-                raise KeyError(f"Top-level key '{key}' not found in the table.")
-            else:
-                bottom_level_values = self.external_table_array[key_position_outer_table][1].values()
-                return bottom_level_values
+            return self._subtables[self._find_outer_slot(key)].values()
 
     # correct
     def __contains__(self, key: tuple[K1, K2]) -> bool:
@@ -373,9 +411,9 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         """
         top_level_key, bottom_level_key = key
         top_level_position, bottom_table_position = self._linear_probe(top_level_key, bottom_level_key, False)
-        item = (self.external_table_array[top_level_position][1])[bottom_level_key]
 
-        return item
+        # Read straight from the probed slot rather than probing the inner table again.
+        return self._subtables[top_level_position]._values[bottom_table_position]
 
     def __setitem__(self, key: tuple[K1, K2], data: V) -> None:
         """
@@ -385,6 +423,9 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         key: A tuple containing the two keys.
         value: The value to be set.
 
+        Raises:
+        TypeError: When either key is None, which the key arrays use to mark empty slots.
+
         Complexity
         Best: O(1) when both keys immediately resolve to an empty slot without collisions.
         Worst: O(n + m) in the worst case, potentially followed by a rehash operation, where
@@ -394,13 +435,42 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         """
 
         top_key, bottom_key = key
+        if top_key is None or bottom_key is None:
+            raise TypeError(f"DoubleKeyTable keys cannot be None, got {key!r}.")
         top_level_position, bottom_level_position = self._linear_probe(top_key, bottom_key, True)
 
-        (self.external_table_array[top_level_position][1])[bottom_key] = data
+        bottom_level_table = self._subtables[top_level_position]
+        previous_length = len(bottom_level_table)
+        bottom_level_table[bottom_key] = data
+        if len(bottom_level_table) > previous_length:
+            self._item_count += 1
 
-        if self.external_table_length > self.table_size / 2:
+        if self.external_table_length * 2 > self.table_size:
             self._rehash()
 
+    def update(self, pairs: Iterable[tuple[tuple[K1, K2], V]], count_hint: int | None = None) -> None:
+        """
+        Insert or update many key pairs at once.
+
+        Args:
+        - pairs: An iterable of ((key1, key2), value) items.
+        - count_hint (int, optional): Number of distinct top-level keys expected. If given, the outer table is
+          grown once up front instead of rehashing repeatedly while the pairs are inserted.
+
+        Complexity:
+        Best: O(P) where P is the number of pairs, when every pair resolves without collisions and the
+        outer table was reserved up front.
+        Worst: O(P*(n + m)) plus any rehashes, where n is the size of the outer table and m is the
+        size of the inner table (see __setitem__).
+        """
+        if count_hint is not None:
+            self.reserve(count_hint)
+
+        # The load-factor check in __setitem__ stays: it is an integer compare, and it is what
+        # stops the outer table filling up when the hint is missing or too small.
+        for key, data in pairs:
+            self[key] = data
+
     def __delitem__(self, key: tuple[K1, K2]) -> None:
         """
         Remove a value from the hash table for a given key pair.
@@ -419,29 +489,45 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         """
 
         top_table_key, bottom_table_key = key
+        # Raises KeyError if the pair is absent, so no separate membership check is needed.
         top_table_position, bottom_table_position = self._linear_probe(top_table_key, bottom_table_key, False)
 
-        # Ensure the key exists before deletion
-        if (top_table_key, bottom_table_key) not in self:
-            raise KeyError(f"Key pair {key} doesn't exist in the table.")
-
         # Delete the key from the inner hash table
-        del self.external_table_array[top_table_position][1][bottom_table_key]
-
-        # If the inner hash table is empty after deletion, set its entry in the outer table to None
-        if not self.external_table_array[top_table_position][1]:
-            self.external_table_array[top_table_position] = None
+        del self._subtables[top_table_position][bottom_table_key]
+        self._item_count -= 1
+
+        # If the inner hash table is empty after deletion, clear its entry in the outer table
+        if not self._subtables[top_table_position]:
+            keys = self._keys
+            subtables = self._subtables
+            keys[top_table_position] = None
+            subtables[top_table_position] = None
             self.external_table_length -= 1
 
             # Start moving over the cluster
-            top_table_position = (top_table_position + 1) % self.table_size
-            while self.external_table_array[top_table_position] is not None:
-                key2, value = self.external_table_array[top_table_position]
-                self.external_table_array[top_table_position] = None
-                # Reinsert
-                newpos = self._linear_probe_upper_table(key2)
-                self.external_table_array[newpos] = (key2, value)
-                top_table_position = (top_table_position + 1) % self.table_size
+            size = len(keys)
+            top_table_position += 1
+            if top_table_position == size:
+                top_table_position = 0
+            hash1 = self.hash1
+            while keys[top_table_position] is not None:
+                key2 = keys[top_table_position]
+                # Find where key2 would land if its slot were free: the first empty slot
+                # from its hash, or its current slot if that comes first.
+                newpos = hash1(key2)
+                while newpos != top_table_position and keys[newpos] is not None:
+                    newpos += 1
+                    if newpos == size:
+                        newpos = 0
+                # Only move keys that can shift back, stationary keys need no writes.
+                if newpos != top_table_position:
+                    keys[newpos] = key2
+                    subtables[newpos] = subtables[top_table_position]
+                    keys[top_table_position] = None
+                    subtables[top_table_position] = None
+                top_table_position += 1
+                if top_table_position == size:
+                    top_table_position = 0
 
     def _rehash(self) -> None:
         """
@@ -453,46 +539,62 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         Where N is len(self)
         """
 
-        old_upper_table = self.external_table_array
-        self.size_index += 1
-
-        if self.size_index == len(self.external_table_sizes):
-            # Cannot be resized further.
+        if self.size_index + 1 >= len(self.external_table_sizes):
+            # Cannot be resized further. size_index is left on the last size, so
+            # later calls keep returning here rather than indexing past the end.
             return
 
+        old_keys = self._keys
+        old_subtables = self._subtables
+        self.size_index += 1
+
         # Create a new table with the updated size
         new_size = self.external_table_sizes[self.size_index]
-        self.external_table_array = ArrayR(new_size)
+        keys = self._keys = [None] * new_size
+        subtables = self._subtables = [None] * new_size
 
-        for entry in old_upper_table:
-            if entry is not None:
-                key, internal_table = entry
-                newpos = self._linear_probe_upper_table(key)
-                self.external_table_array[newpos] = (key, internal_table)
+        # The probe is inlined so each entry costs one hash1 call rather than a
+        # method call plus its attribute lookups.
+        hash1 = self.hash1
+        for i in range(len(old_keys)):
+            key = old_keys[i]
+            if key is not None:
+                position = hash1(key)
+                start_position = position
+                while keys[position] is not None:
+                    position += 1
+                    if position == new_size:
+                        position = 0
+                    if position == start_position:
+                        raise FullError("Table is full and cannot be rehashed.")
+                keys[position] = key
+                subtables[position] = old_subtables[i]
 
-    def _linear_probe_upper_table(self, key) -> int:
-        """
-        COPIED FROM given LinearProbeTable class
-        Find the correct position for this key in the hash table using linear probing.
-        :complexity best: O(hash(key)) first position is empty
-        :complexity worst: O(hash(key) + N*comp(K)) when we've searched the entire table
-                        where N is the tablesize
-        :raises FullError: When a table is full and cannot be inserted.
+    def _size_index_for(self, n: int) -> int:
         """
+        Return the index of the smallest external size that holds n top-level keys under the load factor,
+        or the largest size if none do.
 
-        position = self.hash1(key)
-        start_position = position  # keep track of where we started
+        :complexity: O(log(S)) where S is the number of external sizes.
+        """
+        return min(bisect_right(self.external_table_sizes, 2 * n), len(self.external_table_sizes) - 1)
 
-        while True:
-            if self.external_table_array[position] is None:
-                # Empty spot. Am I inserting or retrieving?
-                return position
+    def reserve(self, n: int) -> None:
+        """
+        Grow the outer table so that n top-level keys can be inserted without triggering a rehash.
 
-            position = (position + 1) % self.table_size  # Linearly probe to the next spot
+        Args:
+        - n (int): The number of top-level keys to make room for.
 
-            # Check if we've looped all the way back to the starting point
-            if position == start_position:
-                raise FullError("Table is full and cannot be inserted.")
+        Complexity:
+        Best: O(log(S)) when the table is already large enough, where S is the number of external sizes.
+        Worst: O(N*hash(K1) + N^2*comp(K1)) for the single rehash, where N is the number of top-level keys.
+        """
+        target_index = self._size_index_for(n)
+        if target_index > self.size_index:
+            # _rehash steps up one size, so land it directly on the target.
+            self.size_index = target_index - 1
+            self._rehash()
 
     @property
     def table_size(self) -> int:
@@ -506,7 +608,7 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         Both Best and Worst case are both O(1) as we are just returning a numeric
         value.
         """
-        return len(self.external_table_array)
+        return len(self._keys)
 
     def __len__(self) -> int:
         """
@@ -516,14 +618,9 @@ class DoubleKeyTable(Generic[K1, K2, V]):
         int: Total number of items in the table.
 
         Complexity:
-        Both best and worst case is O(n*m) where n is the size of the outer table and
-        m is the maximum size of the inner tables.
-        """
-        count = 0
-        for entry in self.external_table_array:
-            if entry is not None:
-                count += len(entry[1])
-        return count
+        Both best and worst case is O(1) as the count is maintained by __setitem__ and __delitem__.
+        """
+        return self._item_count
 
     def __str__(self) -> str:
         """
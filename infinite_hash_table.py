@@ -1,6 +1,4 @@
-from typing import Generic, TypeVar
-from algorithms.mergesort import mergesort
-from data_structures.referential_array import ArrayR
+from typing import Generic, Iterator, TypeVar
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -14,6 +12,11 @@ class InfiniteHashTable(Generic[K, V]):
     - TABLE_SIZE: An integer constant representing the size of the hash table.
     - level: The depth level of the current hash table in the nested structure.
     - table: The actual storage array of the hash table.
+    - count: The number of key-value pairs stored in this table and all tables nested under it.
+
+    Each slot holds None, a (key, value) tuple, or a nested InfiniteHashTable. Nested tables are
+    always created as plain InfiniteHashTable, so slots are told apart with an exact `type(...) is`
+    check, which is cheaper than isinstance when the slot holds a tuple.
     """
 
     TABLE_SIZE = 27
@@ -26,10 +29,13 @@ class InfiniteHashTable(Generic[K, V]):
         - level (int): The depth level for the table. Defaults to 0 for the topmost table.
 
         Complexity:
-        Best and Worst case are both O(n) where n is the size/length of the ArrayR in general cases
+        Best and Worst case are both O(n) where n is the size/length of the table in general cases
         """
         self.level = level
-        self.table = ArrayR(self.TABLE_SIZE)
+        # A plain list rather than ArrayR: nested tables are created on every split, and a list
+        # is both cheaper to allocate and indexed in C on every level of a walk.
+        self.table: list = [None] * self.TABLE_SIZE
+        self.count = 0
 
     def hash(self, key: K) -> int:
         """
@@ -62,14 +68,22 @@ class InfiniteHashTable(Generic[K, V]):
        Best Case: O(1), if the key is found at the current table level
        Worst Case: O(d), where d is the depth of nested tables for the key
        """
-        index = self.hash(key)
-        entry = self.table[index]
-
-        if isinstance(entry, InfiniteHashTable):
-            return entry[key]
-        if entry and entry[0] == key:
-            return entry[1]
-        raise KeyError(key)
+        # Walk down the nested tables in a loop rather than recursing once per level.
+        # The index is the one `hash` gives at each level, computed inline.
+        key_length = len(key)
+        last = self.TABLE_SIZE - 1
+        level = self.level
+        node = self
+        while True:
+            index = ord(key[level]) % last if level < key_length else last
+            entry = node.table[index]
+            if type(entry) is InfiniteHashTable:
+                node = entry
+                level += 1
+                continue
+            if entry and entry[0] == key:
+                return entry[1]
+            raise KeyError(key)
 
     def __setitem__(self, key: K, value: V) -> None:
         """
@@ -79,28 +93,67 @@ class InfiniteHashTable(Generic[K, V]):
         - key (K): The key for the value.
         - value (V): The value to set.
 
+        Raises:
+        - ValueError: If the key and a different stored key map to the same index at every level,
+          so no level of nesting can separate them (e.g. "a" and "G").
+
         Complexity:
         Best Case: O(1), if a position is directly available, or we are overwriting
         Worst Case: O(d), where d is the depth of nested tables for the key and
         if we need to go d levels deep to set the value
         """
-        index = self.hash(key)
-        entry = self.table[index]
-
-        if entry is None:
-            self.table[index] = (key, value)
-            return
-        if isinstance(entry, InfiniteHashTable):
-            entry[key] = value
-            return
-        if entry[0] == key:
-            self.table[index] = (key, value)
-            return
-
-        sub_table = InfiniteHashTable(self.level + 1)
-        sub_table[entry[0]] = entry[1]
-        sub_table[key] = value
-        self.table[index] = sub_table
+        key_length = len(key)
+        last = self.TABLE_SIZE - 1
+        level = self.level
+        node = self
+        # Every table on the way down holds the new pair once it is inserted.
+        visited = []
+        # Set once the new key is known to part from the colliding pair at some deeper level.
+        separated = False
+        while True:
+            visited.append(node)
+            index = ord(key[level]) % last if level < key_length else last
+            table = node.table
+            entry = table[index]
+
+            if type(entry) is InfiniteHashTable:
+                node = entry
+                level += 1
+                continue
+            if entry is None:
+                table[index] = (key, value)
+                for table_on_path in visited:
+                    table_on_path.count += 1
+                return
+            if entry[0] == key:
+                table[index] = (key, value)
+                return
+
+            # Collision with a different key: move the existing pair one level down,
+            # then keep walking with the new key until the two keys separate.
+            entry_key = entry[0]
+            if not separated:
+                # Check the keys part at some deeper level before changing any table,
+                # so a rejected insert leaves the structure exactly as it was.
+                entry_length = len(entry_key)
+                probe_level = level
+                while True:
+                    if probe_level >= key_length and probe_level >= entry_length:
+                        # Both keys have run out of characters, so they share every index from here on.
+                        raise ValueError(f"Keys {key!r} and {entry_key!r} map to the same location at every level.")
+                    probe_level += 1
+                    key_index = ord(key[probe_level]) % last if probe_level < key_length else last
+                    entry_index = ord(entry_key[probe_level]) % last if probe_level < entry_length else last
+                    if key_index != entry_index:
+                        break
+                separated = True
+            level += 1
+            sub_table = InfiniteHashTable(level)
+            sub_index = ord(entry_key[level]) % last if level < len(entry_key) else last
+            sub_table.table[sub_index] = entry
+            sub_table.count = 1
+            table[index] = sub_table
+            node = sub_table
 
     def __delitem__(self, key: K) -> None:
         """
@@ -113,30 +166,37 @@ class InfiniteHashTable(Generic[K, V]):
         Best Case: O(1), if the key is found at the initial table level 0
         Worst Case: O(d), where d is the depth of nested tables for the key
         """
-        index = self.hash(key)
-        entry = self.table[index]
-
-        if entry is None:
-            raise KeyError(key)
-
-        # If it's a nested-table, delegate the deletion to it.
-        if isinstance(entry, InfiniteHashTable):
-            del entry[key]
-            # After deleting, if the nested-table has only one item left, elevate that item.
-            if len(entry) == 1:
-                k, v = next(iter(entry.items()))
-                self.table[index] = (k, v)
-            # If it's empty, set the slot to None.
-            elif len(entry) == 0:
-                self.table[index] = None
-            return
+        # Walk down to the pair, remembering the (table, index) of every nested table passed through.
+        key_length = len(key)
+        last = self.TABLE_SIZE - 1
+        level = self.level
+        node = self
+        path = []
+        while True:
+            index = ord(key[level]) % last if level < key_length else last
+            entry = node.table[index]
+            if type(entry) is not InfiniteHashTable:
+                break
+            path.append((node, index))
+            node = entry
+            level += 1
 
         # If it's a key-value pair, delete if the key matches.
-        if entry[0] == key:
-            self.table[index] = None
-            return
-
-        raise KeyError(key)
+        if entry is None or entry[0] != key:
+            raise KeyError(key)
+        node.table[index] = None
+        node.count -= 1
+
+        # Walk back up. If a nested-table has only one item left, elevate that item,
+        # and if it's empty, set the slot to None.
+        for parent, index in reversed(path):
+            parent.count -= 1
+            sub_table = parent.table[index]
+            remaining = sub_table.count
+            if remaining == 1:
+                parent.table[index] = sub_table.items()[0]
+            elif remaining == 0:
+                parent.table[index] = None
 
     def __len__(self) -> int:
         """
@@ -146,20 +206,9 @@ class InfiniteHashTable(Generic[K, V]):
         int: The number of key-value pairs.
 
         Complexity:
-        Best Case: O(TABLE_SIZE), when there are no nested tables and all the keys are at level 0
-        Worst Case: O(TABLE_SIZE * d), where d is the depth of nested tables
+        Best and Worst case are both O(1) as the count is maintained by __setitem__ and __delitem__.
         """
-        count = 0
-        for item in self.table:
-            if item is None:
-                continue
-            # If the item is another hash table, recursively count its items
-            if isinstance(item, InfiniteHashTable):
-                count += len(item)
-            # If the item is a value, increment the count
-            else:
-                count += 1
-        return count
+        return self.count
 
     def get_location(self, key: K) -> list[int]:
         """
@@ -175,46 +224,41 @@ class InfiniteHashTable(Generic[K, V]):
         Best Case: O(1), if the key is found at the initial table level 0
         Worst Case: O(d), where d is the depth of nested tables for the key
         """
-        index = self.hash(key)
-        entry = self.table[index]
-
-        if entry is None:
+        key_length = len(key)
+        last = self.TABLE_SIZE - 1
+        level = self.level
+        node = self
+        location = []
+        while True:
+            index = ord(key[level]) % last if level < key_length else last
+            location.append(index)
+            entry = node.table[index]
+            if type(entry) is InfiniteHashTable:
+                node = entry
+                level += 1
+                continue
+            if entry and entry[0] == key:
+                return location
             raise KeyError(key)
-        if isinstance(entry, InfiniteHashTable):
-            return [index] + entry.get_location(key)
-        if entry[0] == key:
-            return [index]
-        raise KeyError(key)
 
     def sort_keys(self) -> list[str]:
         """
-        Returns a list of keys sorted in lexicographical order using mergesort.
+        Returns a list of keys sorted in lexicographical order using the built-in sorted (Timsort).
 
         Returns:
         List[str]: Sorted keys.
 
         Complexity:
 
-        Best Case: O(n*log(n)) - Due to the sorting operation by mergesort which has complexity
-        of O(n*log(n)) and n is the number of items/keys in the infinite hash table. The best-case
-        scenario would occur when all keys are present at the level 0 with no nested hash tables.
-
-        Worst Case: O(n*log(n)) - Due to the sorting operation by mergesort which has complexity
-        of O(n*log(n)) and n is the number items/keys in the infinite hash table.
-        In the worst-case scenario, the keys can be distributed evenly across all nested hash tables
-        up to a depth of d. The sort_keys function would be called recursively d times for each nested
-        table. However, the way mergesort works, sorting the keys at each level doesn't stack
-        multiplicatively with depth, since the keys are partitioned and then combined. The worst-case
-        complexity will then be O(d*n + n*logn). But, Since nlogn will grow faster than d×n for a large n,
-        the nlogn term dominates and hence the worst case complexity.
-        """
-        keys = []
-        for i, entry in enumerate(self.table):
-            if isinstance(entry, InfiniteHashTable):
-                keys.extend(entry.sort_keys())
-            elif entry:
-                keys.append(entry[0])
-        return mergesort(keys)
+        Best Case: O(n) - when the collected keys are already in order, Timsort only has to confirm
+        the single run, where n is the number of items/keys in the infinite hash table.
+
+        Worst Case: O(d*n + n*log(n)) - collecting the keys visits every nested table up to a depth of d,
+        and then one sort over all n keys is O(n*log(n)). Since nlogn will grow faster than d×n for a
+        large n, the nlogn term dominates. Sorting happens once for the whole table, rather than again
+        at every nested level.
+        """
+        return sorted([key for key, _ in self._iter_items()])
 
     def items(self) -> list[tuple[K, V]]:
         """
@@ -228,10 +272,26 @@ class InfiniteHashTable(Generic[K, V]):
         and there are no nested-tables
         Worst Case: O(TABLE_SIZE * d) where d is the depth of nested tables
         """
-        result = []
-        for entry in self.table:
-            if isinstance(entry, InfiniteHashTable):
-                result.extend(entry.items())
-            elif entry:
-                result.append(entry)
-        return result
+        return list(self._iter_items())
+
+    def _iter_items(self) -> Iterator[tuple[K, V]]:
+        """
+        Yield every key-value pair, walking nested tables depth-first in slot order.
+
+        The walk keeps an explicit stack of slot iterators, so no per-table
+        lists are built and merged on the way back up.
+
+        Complexity:
+        Best Case: O(TABLE_SIZE), when there are no nested-tables
+        Worst Case: O(TABLE_SIZE * t) where t is the number of tables in the whole structure
+        """
+        stack = [iter(self.table)]
+        while stack:
+            for entry in stack[-1]:
+                if type(entry) is InfiniteHashTable:
+                    stack.append(iter(entry.table))
+                    break
+                if entry is not None:
+                    yield entry
+            else:
+                stack.pop()
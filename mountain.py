@@ -10,54 +10,34 @@ class Mountain:
 
     # Define the equality comparison method.
     def __eq__(self, other):
-        # Check if the difficulty levels and names of two mountains are equal.
-        if self.difficulty_level == other.difficulty_level:
-            if self.name == other.name:
-                # Return True if both mountains are equal.
-                return self.name == other.name
-        # Return False if any of the conditions are not met.
+        # Two mountains are equal when their difficulty levels and names are equal.
+        if not isinstance(other, Mountain):
+            return NotImplemented
+        return self.difficulty_level == other.difficulty_level and self.name == other.name
+
+    # Hash on the same fields as __eq__, so mountains can be used as dict keys.
+    # A mountain must not be edited while it is a key somewhere.
+    def __hash__(self):
+        return hash((self.difficulty_level, self.name))
+
+    # The ordering methods compare (difficulty_level, name) as a tuple, which is a
+    # single C-level comparison instead of a chain of Python branches.
 
     # Define the less than comparison method.
     def __lt__(self, other):
-        # Check if the difficulty level of self is less than the difficulty level of other.
-        if self.difficulty_level < other.difficulty_level:
-            return self.difficulty_level < other.difficulty_level
-        # If difficulty levels are equal, check lexicographic order of names.
-        elif self.difficulty_level > other.difficulty_level:
-            return False
-        elif self.difficulty_level == other.difficulty_level:
-            return self.name < other.name
+        return (self.difficulty_level, self.name) < (other.difficulty_level, other.name)
 
     # Define the greater than comparison method.
     def __gt__(self, other):
-        # Check if the difficulty level of self is greater than the difficulty level of other.
-        if self.difficulty_level > other.difficulty_level:
-            return self.difficulty_level > other.difficulty_level
-        # If difficulty levels are equal, check lexicographic order of names.
-        elif self.difficulty_level < other.difficulty_level:
-            return False
-        elif self.difficulty_level == other.difficulty_level:
-            return self.name > other.name
+        return (self.difficulty_level, self.name) > (other.difficulty_level, other.name)
 
     # Define the less than or equal to comparison method.
     def __le__(self, other):
-        # Check if the difficulty level of self is less than or equal to the difficulty level of other.
-        if self.difficulty_level < other.difficulty_level:
-            return True
-        # If difficulty levels are equal, check lexicographic order of names.
-        if self.difficulty_level == other.difficulty_level:
-            return self.name <= other.name
-        # Return False if self's difficulty level is greater than other's.
+        return (self.difficulty_level, self.name) <= (other.difficulty_level, other.name)
 
     # Define the greater than or equal to comparison method.
     def __ge__(self, other):
-        # Check if the difficulty level of self is greater than or equal to the difficulty level of other.
-        if self.difficulty_level > other.difficulty_level:
-            return True
-        # If difficulty levels are equal, check lexicographic order of names.
-        if self.difficulty_level == other.difficulty_level:
-            return self.name >= other.name
-        # Return False if self's difficulty level is less than other's.
+        return (self.difficulty_level, self.name) >= (other.difficulty_level, other.name)
 
     def get_name(self) -> str:
         return self.name
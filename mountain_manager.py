@@ -1,7 +1,5 @@
 from __future__ import annotations
 from mountain import Mountain
-from infinite_hash_table import InfiniteHashTable
-from data_structures.hash_table import LinearProbeTable
 
 
 class MountainManager:
@@ -10,13 +8,13 @@ class MountainManager:
     difficulty level, and length. And also, sort and group mountains by a particular difficulty level.
 
     Attributes:
-    mountains (LinearProbeTable): A table containing mountains identified by their names (assuming names are
-    generally unique for any mountains).
-    difficulty_groups (InfiniteHashTable): A table that groups mountains based on their difficulty level.
+    mountains (dict[str, tuple[int, int]]): The (difficulty_level, length) of each mountain, identified by their
+    names (assuming names are generally unique for any mountains).
+    difficulty_groups (dict[int, list[Mountain]]): Lists of mountains keyed by their (integer) difficulty level.
+    Empty groups are removed, so every list in it holds at least one mountain.
 
     Note:
-    Both LinearProbeTable and InfiniteHashTable are assumed to have O(1) best and worst case complexities
-    for their operations.
+    dict operations are assumed to be O(1).
     """
 
     def __init__(self) -> None:
@@ -24,13 +22,11 @@ class MountainManager:
         Initialises a new MountainManager with empty mountains and difficulty_groups tables.
 
         Complexity:
-        Best Case: O(1) as we are simply creating new LinearProbeTable and InfiniteHashTable objects,
-        both of which are O(1).
-        Worst Case: O(1) as we are simply creating new LinearProbeTable and InfiniteHashTable objects,
-        both of which are O(1).
+        Best Case: O(1) as we are simply creating two empty dicts.
+        Worst Case: O(1) as we are simply creating two empty dicts.
         """
-        self.mountains = LinearProbeTable()
-        self.difficulty_groups = InfiniteHashTable()
+        self.mountains: dict[str, tuple[int, int]] = {}
+        self.difficulty_groups: dict[int, list[Mountain]] = {}
 
     def add_mountain(self, mountain: Mountain) -> None:
         """
@@ -43,25 +39,21 @@ class MountainManager:
         ValueError: If the mountain with the given name already exists.
 
         Complexity:
-        Best Case: O(1) as setitem operation (and all other operations for LinearProbeTable and
-        InfiniteHashTable) are assumed to be O(1)
-        Worst Case: O(1) as setitem operation (and all other operations for LinearProbeTable and
-        InfiniteHashTable) are assumed to be O(1)
+        Best Case: O(1) as dict operations are assumed to be O(1), and appending to a group is amortised O(1)
+        Worst Case: O(1) as dict operations are assumed to be O(1), and appending to a group is amortised O(1)
         """
-        mountain_name = mountain.get_name()
-        mountain_difficulty_level = str(mountain.get_difficulty_level())
-        mountain_length = mountain.get_length()
+        # Read the fields once, directly, rather than through a getter call each.
+        mountain_name = mountain.name
+        mountain_difficulty_level = mountain.difficulty_level
+        mountain_length = mountain.length
 
         if mountain_name in self.mountains:
             raise ValueError(f"Mountain with name {mountain_name} already exists!")
 
         self.mountains[mountain_name] = (mountain_difficulty_level, mountain_length)
 
-        try:
-            if mountain not in self.difficulty_groups[str(mountain_difficulty_level)]:
-                self.difficulty_groups[str(mountain_difficulty_level)].append(mountain)
-        except KeyError:
-            self.difficulty_groups[str(mountain_difficulty_level)] = [mountain]
+        # Names are unique (checked above), so the mountain cannot already be in its group.
+        self.difficulty_groups.setdefault(mountain_difficulty_level, []).append(mountain)
 
     def remove_mountain(self, mountain: Mountain) -> None:
         """
@@ -71,24 +63,25 @@ class MountainManager:
         mountain (Mountain): The mountain object to be removed.
 
         Complexity:
-        Best Case: O(1) as delitem operation (and all other operations for LinearProbeTable and
-        InfiniteHashTable) are assumed to be O(1)
-        Worst Case: O(1) as as delitem operation (and all other operations for LinearProbeTable and
-        InfiniteHashTable) are assumed to be O(1)
+        Best Case: O(1) as dict operations are assumed to be O(1), and the mountain is found at the start
+        of its group
+        Worst Case: O(m) where m is the number of mountains with the same difficulty level, as the mountain
+        has to be found in its group
         """
-        mountain_name = mountain.get_name()
-        mountain_difficulty_level = str(mountain.get_difficulty_level())
+        mountain_name = mountain.name
+        mountain_difficulty_level = mountain.difficulty_level
         del self.mountains[mountain_name]
-        self.difficulty_groups[mountain_difficulty_level].remove(mountain)
-        if not self.difficulty_groups[mountain_difficulty_level]:
+        group = self.difficulty_groups[mountain_difficulty_level]
+        group.remove(mountain)
+        if not group:
             del self.difficulty_groups[mountain_difficulty_level]
 
     def edit_mountain(self, old: Mountain, new: Mountain) -> None:
         """
         Edits the details of an existing mountain. This is achieved by removing the old mountain details
         (remove the whole mountain object) and adding the new mountain details (adding a whole new mountain
-        object). Since, all the operations are assumed to be O(1) for LinearProbeTable and InfiniteHashTable,
-        this is still efficient and O(1).
+        object). Since, all the dict operations are assumed to be O(1), this is efficient apart from finding the
+        old mountain in its difficulty group.
 
         Args:
         old (Mountain): The old mountain object which needs to be edited.
@@ -96,7 +89,7 @@ class MountainManager:
 
         Complexity:
         Best Case: O(1) as the remove_mountain and add_mountain have the best case O(1)
-        Worst Case: O(1) as the remove_mountain and add_mountain have the worst case O(1)
+        Worst Case: O(m) as the remove_mountain has the worst case O(m), see remove_mountain
         """
         self.remove_mountain(old)
         self.add_mountain(new)
@@ -112,13 +105,10 @@ class MountainManager:
         list[Mountain]: A list of mountains with the specified difficulty level.
 
         Complexity:
-        Best Case: O(1) as all the operations for InfiniteHashTable have the worst case O(1)
-        Worst Case: O(1) as all the operation for InfiniteHashTable have the worst case O(1)
+        Best Case: O(1) as it is a single dict lookup
+        Worst Case: O(1) as it is a single dict lookup
         """
-        try:
-            return self.difficulty_groups[str(diff)]
-        except KeyError:
-            return []
+        return self.difficulty_groups.get(diff, [])
 
     def group_by_difficulty(self) -> list[list[Mountain]]:
         """
@@ -128,12 +118,10 @@ class MountainManager:
         list[list[Mountain]]: A nested list where each sublist contains mountains of a specific difficulty level.
 
         Complexity:
-        Best Case: O(n*m), where n is the number of difficulty levels and m is the number of mountains with a
-        particular difficulty level. The sort_keys() is O(1) by our assumption that all InfiniteHashTable operations
-        are O(1)
-        Worst Case: O(n*m), where n is the number of difficulty levels and m is the number of mountains with a
-        particular difficulty level. The sort_keys() is O(1) by our assumption that all InfiniteHashTable operations
-        are O(1)
+        Best Case: O(n*log(n)), where n is the number of difficulty levels, for sorting the levels.
+        The groups themselves are not copied.
+        Worst Case: O(n*log(n)), where n is the number of difficulty levels, for sorting the levels.
+        The groups themselves are not copied.
         """
-        difficulties = self.difficulty_groups.sort_keys()
-        return [self.difficulty_groups[diff] for diff in difficulties if self.difficulty_groups[diff]]
+        # Integer keys sort numerically, so difficulty 10 comes after difficulty 2.
+        return [group for _, group in sorted(self.difficulty_groups.items())]
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from operator import attrgetter, itemgetter
+
 from mountain import Mountain
 
-from algorithms import binary_search, mergesort
+# The (difficulty_level, name) tuple that Mountain's ordering methods compare, built in C.
+_sort_key = attrgetter("difficulty_level", "name")
 
 class MountainOrganiser:
 
@@ -15,6 +20,11 @@ class MountainOrganiser:
         This __init__ method initializes the MountainOrganiser to start organizing mountains. The variables initialized are:
 
              - self.mountain_list: contains the list of all the mountains arranged based either their difficulty level or name.
+             - self.mountain_keys: the (difficulty_level, name) key of each mountain in mountain_list, at the same index. Searching these tuples
+               compares them in C, instead of calling Mountain.__lt__ for every comparison.
+             - self.mountain_rankings: maps each mountain to its position (rank) within mountain_list.
+             - self.rankings_outdated: True when mountains have been added since mountain_rankings was last rebuilt.
+             - self.lookups_since_add: the number of cur_position calls since mountain_rankings became outdated.
 
         Complexity Analysis:
 
@@ -24,14 +34,19 @@ class MountainOrganiser:
         """
 
         self.mountain_list = []
+        self.mountain_keys: list[tuple[int, str]] = []
+        self.mountain_rankings: dict[Mountain, int] = {}
+        self.rankings_outdated = False
+        self.lookups_since_add = 0
 
     def cur_position(self, mountain: Mountain) -> int:
 
         """
 
-        This cur_position method returns the rank (position) of the given mountain in the organiser using Binary Search. Based on the provided mountain_list, we 
-        perform BinarySearch and store the position of the mountain we are trying to search within the variable mountain_ranking. After, we return the 
-        value of mountain_ranking.
+        This cur_position method returns the rank (position) of the given mountain in the organiser using the dictionary mountain_rankings, which maps
+        every mountain to its position within mountain_list. Adding mountains shifts the positions of the mountains after them, so add_mountains only
+        marks mountain_rankings as outdated. While it is outdated, a few lookups are answered with bisect_left on mountain_keys (a binary search in C),
+        and once there have been enough of them to pay for it, mountain_rankings is rebuilt. Lookups after that are a single dictionary access.
 
         Parameters:
         - mountain (Mountain): The mountain to find the rank for.
@@ -50,37 +65,55 @@ class MountainOrganiser:
 
         Complexity Analysis:
 
-        Based on the analysis given below for all the individual functions, the best case complexity is O(1). This is when the mountain is
-        in the middle of mountain_list of size N, where N is the total number of mountains included so far.
+        The best case complexity is O(1). This is when mountain_rankings is up to date, so the rank is a single dictionary access.
 
-        Based on the analysis given below for all the individual functions, the worst case complexity is O(logN), where N is the 
-        total number of mountains included so far. This would occur when the position of the mountain is less than or greater than the middle.
-        Since the search pool is halved each time, it will take a maximum of O(logN) comparisions in order to find the mountain. Hence, the worst 
-        case occurs when it takes O(logN) comparisons to find the mountain within mountain_list.
+        The worst case complexity is O(N), where N is the total number of mountains included so far. This occurs on the lookup that rebuilds
+        mountain_rankings from mountain_list. That only happens after about N/16 lookups since the last add, each of which cost O(log(N)) with
+        bisect_left, so a run of lookups costs O(log(N)) each on average and then O(1) each once rebuilt.
 
         """
-        
-        #complexity of the mountain_ranking is O(log(N)), where N is the total # of mountains
-        mountain_ranking = binary_search.binary_search(self.mountain_list, mountain)  # O(logN)
-
-        if self.mountain_list[mountain_ranking] != mountain:  # O(1)
 
+        if self.rankings_outdated:
+            mountain_list = self.mountain_list
+            self.lookups_since_add += 1
+
+            # A rebuild costs about N dictionary inserts, so until there have been N/16 lookups it is cheaper to binary search.
+            if self.lookups_since_add * 16 < len(mountain_list):
+                mountain_keys = self.mountain_keys
+                key = _sort_key(mountain)
+                mountain_ranking = bisect_left(mountain_keys, key)  # O(log(N))
+                if mountain_ranking == len(mountain_keys) or mountain_keys[mountain_ranking] != key:
+                    raise KeyError("Error. The mountain was not found in the list.")
+                return mountain_ranking
+
+            # Rebuild once for all the lookups until the next add. O(N)
+            # Enumerated in reverse so equal mountains keep their first position, matching bisect_left above.
+            self.mountain_rankings = {m: i for i, m in reversed(list(enumerate(mountain_list)))}
+            self.rankings_outdated = False
+
+        try:
+            return self.mountain_rankings[mountain]  # O(1)
+        except KeyError:
             raise KeyError("Error. The mountain was not found in the list.")  # O(1)
-        
-        return mountain_ranking  # O(1)
 
     def add_mountains(self, mountains: list[Mountain]) -> None:
 
         """
 
-        This method add_mountains stores the mountains (list[Mountain]) into a new list, and conducts the mergesort() operation to sort the new list.
-        Each mountain is sorted based on their difficulty level, accessed within the Mountain class. If two mountains have the same difficulty
-        level, then the name of the mountains are compared together instead and sorting in lexicographical order.
+        This method add_mountains inserts the mountains (list[Mountain]) into mountain_list, keeping it sorted. Each mountain is sorted based on their
+        difficulty level, accessed within the Mountain class. If two mountains have the same difficulty level, then the name of the mountains are
+        compared together instead and sorting in lexicographical order.
 
         Within the Mountain class, I have defined magic methods which implement the logic to first sort the mountains based on their difficulty level,
         and then their name if need be.
 
-        After, using the merge() operation, the new list is merged together with the existing list mountain_list to produce a new list.
+        Both paths search and merge on mountain_keys, the (difficulty_level, name) tuples of the mountains, rather than on the mountains themselves.
+        This orders them exactly as the magic methods do, but each comparison is a tuple comparison in C instead of a call to Mountain.__lt__.
+
+        For a small batch, each mountain's position is found with bisect_right, a binary search over mountain_keys, and the mountain and its key
+        are inserted at that position, shifting the rest of both lists in C. For a larger batch, the new mountains are sorted with the built-in
+        sorted() (Timsort) and then merged with the existing list using heapq.merge. Both paths keep existing mountains ahead of new mountains that
+        compare equal, as the previous merge() did.
 
         Parameters:
         - mountains (list[Mountain]): A list of Mountain objects to be added to the organiser.
@@ -93,21 +126,36 @@ class MountainOrganiser:
         The complexity analysis is being conducted assumes that there is a large input size of 'M', where M is the length of the input list 'mountains'.
         'N' is the total number of mountains having combined the smaller lists together.
 
-        Within mergesort(), the complexity is Mlog(M) because mergesort will divide the inputted into M sublists. This takes log(N) time, as the size of
-        the inputted list is divided in half at each level of recursion. Then, the sublists are merged to produce larger sorted sublists. This merging 
-        step takes O(M) time for each level of recursion.
+        When M is small compared to N (4*M < N), each insort costs O(log(N)) comparisons plus an O(N) shift of the list, which is a single memmove in C.
+        This gives O(M*log(N) + M*N), with a very small constant on the M*N term.
+
+        Otherwise, sorted() takes O(Mlog(M)), and merging with the existing list takes O(N), as the length of the inputted list and the length of the
+        existing list combine to form the total length of N mountains.
 
-        Within merge(), the complexity is O(N) because the length of the inputted list and the length of the existing list combine to form the total
-        length of N mountains. 
-        
-        Based on the analysis given below for all the individual functions, the best case complexity will be O(Mlog(M) + N). This occurs when the inputted 
-        list of mountains is already sorted, however, each element will still undergo comparisons. 
+        Based on the analysis given below for all the individual functions, the best case complexity will be O(M + N). This occurs when the inputted
+        list of mountains is already sorted, since Timsort only has to confirm the single run.
 
-        Based on the analysis given below for all the individual functions, the worst case complexity will also be O(Mlog(M) + N). This occurs when the inputted 
-        list of mountains is sorted in the opposite order, however, the number of operations will not grow, as the same number of operations based on the length
-        of the list will be conducted.
+        Based on the analysis given below for all the individual functions, the worst case complexity will be O(Mlog(M) + N) for a large batch, and
+        O(M*log(N) + M*N) for a small batch.
 
         """
 
-        sorted_mountain_list = mergesort.mergesort(mountains)  # O(Mlog(M))
-        self.mountain_list = mergesort.merge(self.mountain_list, sorted_mountain_list)  # O(N)
\ No newline at end of file
+        mountain_list = self.mountain_list
+        mountain_keys = self.mountain_keys
+
+        if len(mountains) * 4 < len(mountain_list):
+            for mountain in mountains:
+                key = _sort_key(mountain)
+                position = bisect_right(mountain_keys, key)  # O(log(N)) comparisons
+                mountain_keys.insert(position, key)  # O(N) shift
+                mountain_list.insert(position, mountain)  # O(N) shift
+        else:
+            by_key = itemgetter(0)
+            new_pairs = sorted(zip(map(_sort_key, mountains), mountains), key=by_key)  # O(Mlog(M))
+            merged = list(merge(zip(mountain_keys, mountain_list), new_pairs, key=by_key))  # O(N)
+            self.mountain_keys = [key for key, _ in merged]
+            self.mountain_list = [mountain for _, mountain in merged]
+
+        # Positions after each inserted mountain have shifted, cur_position rebuilds the rankings when next needed.
+        self.rankings_outdated = True
+        self.lookups_since_add = 0
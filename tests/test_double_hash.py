@@ -2,6 +2,7 @@ import unittest
 from ed_utils.decorators import number
 
 from double_key_table import DoubleKeyTable
+from data_structures.hash_table import FullError
 
 class TestDoubleHash(unittest.TestCase):
 
@@ -123,3 +124,78 @@ class TestDoubleHash(unittest.TestCase):
         # with an iterator.
         self.assertRaises(BaseException, lambda: next(key_iterator))
         self.assertRaises(BaseException, lambda: next(value_iterator))
+
+    @number("3.6")
+    def test_keys_values_wrap_around(self):
+        # Disable resizing / rehashing.
+        dt = DoubleKeyTable(sizes=[5], internal_sizes=[5])
+        # Every top-level key collides, so the cluster wraps past the end of the outer table.
+        dt.hash1 = lambda k: 4
+        dt.hash2 = lambda k, sub_table: ord(k[-1]) % 5
+
+        dt["Tim", "Jen"] = 1
+        dt["Amy", "Ben"] = 2
+        dt["Amy", "Bob"] = 3
+
+        self.assertEqual(dt._linear_probe("Amy", "Ben", False)[0], 0)
+        self.assertEqual(set(dt.keys("Amy")), {"Ben", "Bob"})
+        self.assertEqual(set(dt.iter_keys("Amy")), {"Ben", "Bob"})
+        self.assertEqual(set(dt.values("Amy")), {2, 3})
+        self.assertEqual(set(dt.iter_values("Amy")), {2, 3})
+        self.assertRaises(KeyError, lambda: dt.keys("May"))
+
+    @number("3.7")
+    def test_reserve(self):
+        dt = DoubleKeyTable(expected_items=100)
+        self.assertEqual(dt.table_size, 389)
+
+        dt = DoubleKeyTable(sizes=[3, 5, 11, 23])
+        dt["Tim", "Bob"] = 1
+        dt.reserve(10)
+        self.assertEqual(dt.table_size, 23)
+        self.assertEqual(dt["Tim", "Bob"], 1)
+        # Reserving less than the current size never shrinks the table.
+        dt.reserve(1)
+        self.assertEqual(dt.table_size, 23)
+
+    @number("3.8")
+    def test_update(self):
+        dt = DoubleKeyTable(sizes=[3, 5, 11, 23])
+        pairs = [((top, bottom), i) for i, (top, bottom) in enumerate(
+            (top, bottom) for top in ["Tim", "Amy", "May", "Ivy"] for bottom in ["Jen", "Ben"]
+        )]
+        dt.update(pairs, count_hint=4)
+
+        # Reserved once up front, so no further resizing happened.
+        self.assertEqual(dt.table_size, 11)
+        self.assertEqual(len(dt), 8)
+        for key, value in pairs:
+            self.assertEqual(dt[key], value)
+
+        # Updating existing keys does not change the length.
+        dt.update([(("Tim", "Jen"), 100)])
+        self.assertEqual(dt["Tim", "Jen"], 100)
+        self.assertEqual(len(dt), 8)
+
+    @number("3.9")
+    def test_rehash_at_largest_size(self):
+        dt = DoubleKeyTable(sizes=[3, 5])
+        # Past the largest size the table stops growing, but inserts keep working until it is full.
+        for i, top in enumerate(["Tim", "Amy", "May", "Ivy", "Jen"]):
+            dt[top, "Bob"] = i
+        self.assertEqual(dt.table_size, 5)
+        self.assertEqual(len(dt), 5)
+        self.assertEqual(dt["Ivy", "Bob"], 3)
+        self.assertRaises(FullError, lambda: dt.__setitem__(("Ben", "Bob"), 5))
+
+    @number("3.10")
+    def test_none_keys(self):
+        dt = DoubleKeyTable()
+        dt["Tim", "Jen"] = 1
+        # None marks empty slots, so it is rejected as either key instead of being lost.
+        self.assertRaises(TypeError, lambda: dt.__setitem__((None, "Jen"), 2))
+        self.assertRaises(TypeError, lambda: dt.__setitem__(("Tim", None), 3))
+        self.assertRaises(TypeError, lambda: dt.update([((None, "Amy"), 4)]))
+        self.assertEqual(len(dt), 1)
+        self.assertListEqual(dt.keys(), ["Tim"])
+        self.assertListEqual(dt.keys("Tim"), ["Jen"])
@@ -91,3 +91,15 @@ class TestInfiniteHash(unittest.TestCase):
             "mining"
         ]
         self.assertListEqual(res, expected)
+
+    @number("4.4")
+    def test_inseparable_keys(self):
+        for first, second in (("a", "G"), ("Ga", "aa"), ("0", "J"), ("ab", "Gb")):
+            ih = InfiniteHashTable()
+            ih[first] = 1
+            location = ih.get_location(first)
+            self.assertRaises(ValueError, lambda: ih.__setitem__(second, 2))
+            self.assertEqual(ih.get_location(first), location)
+            self.assertEqual(ih[first], 1)
+            self.assertEqual(len(ih), 1)
+            self.assertRaises(KeyError, lambda: ih[second])
@@ -56,3 +56,18 @@ class TestInfiniteHash(unittest.TestCase):
         self.assertEqual(len(res), 4)
 
         self.assertEqual(make_set(res[3]), make_set([m10]))
+
+    @number("5.2")
+    def test_group_order_is_numeric(self):
+        m1 = Mountain("m1", 10, 2)
+        m2 = Mountain("m2", 2, 9)
+        m3 = Mountain("m3", 3, 6)
+
+        mm = MountainManager()
+        mm.add_mountain(m1)
+        mm.add_mountain(m2)
+        mm.add_mountain(m3)
+
+        # Difficulty 10 sorts after 2 and 3, not between them.
+        res = mm.group_by_difficulty()
+        self.assertEqual([group[0].name for group in res], ["m2", "m3", "m1"])
@@ -31,3 +31,33 @@ class TestInfiniteHash(unittest.TestCase):
         self.assertEqual([mo.cur_position(m) for m in [m1, m2, m3, m4, m5, m6, m7, m8, m9]], [1, 8, 3, 0, 4, 2, 6, 7, 5])
 
         self.assertRaises(KeyError, lambda: mo.cur_position(m10))
+
+    @number("6.2")
+    def test_lookups_while_outdated(self):
+        mountains = [Mountain(f"m{i:02}", i % 5, 1) for i in range(20)]
+        expected = sorted(mountains)
+
+        mo = MountainOrganiser()
+        mo.add_mountains(mountains)
+
+        # N = 20, so the first lookup after an add uses bisect and the second rebuilds the rankings.
+        self.assertEqual([mo.cur_position(m) for m in mountains], [expected.index(m) for m in mountains])
+        self.assertRaises(KeyError, lambda: mo.cur_position(Mountain("missing", 2, 1)))
+
+        # Equal mountains give their first position on both paths.
+        mo.add_mountains([Mountain("m03", 3, 9)])
+        self.assertEqual([mo.cur_position(mountains[3]) for _ in range(5)], [expected.index(mountains[3])] * 5)
+
+    @number("6.3")
+    def test_small_batch_insert(self):
+        mountains = [Mountain(f"m{i:02}", i % 7, 1) for i in range(20)]
+        extra = [Mountain("x", 3, 1), Mountain("a", 0, 1), Mountain("z", 6, 1)]
+
+        mo = MountainOrganiser()
+        mo.add_mountains(mountains)
+        # 4 * 3 < 20, so these are placed one at a time.
+        mo.add_mountains(extra)
+
+        expected = sorted(mountains + extra)
+        self.assertEqual(mo.mountain_list, expected)
+        self.assertEqual([mo.cur_position(m) for m in extra], [expected.index(m) for m in extra])
@@ -112,3 +112,15 @@ class TestTrailMethods(unittest.TestCase):
         self.assertIsInstance(res, TrailSeries)
         self.assertEqual(res.mountain, m)
         self.assertEqual(res.following.store, None)
+
+    @number("1.5")
+    def test_remove_mountain(self):
+        m, n = Mountain("M", 7, 8), Mountain("N", 2, 3)
+        rest = TrailSeries(n, Trail(None))
+        series = TrailSeries(m, Trail(rest))
+
+        res = series.remove_mountain()
+        self.assertIs(res, rest)
+        self.assertEqual(series.mountain, m)
+
+        self.assertIsNone(TrailSeries(m, Trail(None)).remove_mountain())
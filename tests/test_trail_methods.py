@@ -86,3 +86,31 @@ class TestTrailMethods(unittest.TestCase):
         expected_res.sort()
 
         self.assertListEqual(res, expected_res)
+
+    @number("7.4")
+    def test_iter_mountains(self):
+        self.load_example()
+        res = self.trail.iter_mountains()
+
+        self.assertNotIsInstance(res, list)
+        self.assertListEqual(list(res), self.trail.collect_all_mountains())
+        self.assertListEqual(list(Trail(None).iter_mountains()), [])
+
+    @number("7.5")
+    def test_difficulty_maximum_paths_dead_following(self):
+        self.load_example()
+        # Every path has to pass the mountain after the split, so none survive below its difficulty.
+        trail = Trail(TrailSplit(self.trail, Trail(None), Trail(TrailSeries(self.top_mid, Trail(None)))))
+
+        self.assertListEqual(trail.difficulty_maximum_paths(6), [])
+        self.assertEqual(len(trail.difficulty_maximum_paths(7)), 6)
+
+    @number("7.6")
+    def test_difficulty_maximum_paths_limited(self):
+        self.load_example()
+        all_paths = self.trail.difficulty_maximum_paths(7)
+
+        self.assertEqual(len(all_paths), 5)
+        self.assertListEqual(self.trail.difficulty_maximum_paths(7, max_paths=2), all_paths[:2])
+        self.assertListEqual(self.trail.difficulty_maximum_paths(7, max_paths=10), all_paths)
+        self.assertListEqual(self.trail.difficulty_maximum_paths(7, max_paths=0), [])
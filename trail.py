@@ -3,17 +3,25 @@ from dataclasses import dataclass
 
 from mountain import Mountain
 
-from data_structures import linked_stack, stack_adt
-
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Iterator, Union
 
 # Avoid circular imports for typing.
 if TYPE_CHECKING:
     from personality import WalkerPersonality
 
 
-@dataclass
-class TrailSplit:
+class _TrailNode:
+    """
+    Common base for the trail classes.
+
+    It deliberately has no __slots__, so instances keep a __dict__ for the draw boxes
+    (trail_box, mountain_box, ...) that main.py / draw_trails.py attach to them, while
+    the dataclass fields themselves live in slots.
+    """
+
+
+@dataclass(slots=True)
+class TrailSplit(_TrailNode):
     """
     A split in the trail.
        _____top______
@@ -31,8 +39,8 @@ class TrailSplit:
 
         return TrailSeries(self.following.store.mountain, following = Trail(None))
 
-@dataclass
-class TrailSeries:
+@dataclass(slots=True)
+class TrailSeries(_TrailNode):
     """
     A mountain, followed by the rest of the trail
 
@@ -47,12 +55,11 @@ class TrailSeries:
         """
         Returns a *new* trail which would be the result of:
         Removing the mountain at the beginning of this series.
+        This series is left unchanged, the rest of the trail is returned as it is.
         """
 
-        self.mountain = None
+        return self.following.store
 
-        return TrailSeries(self.mountain, following = self.following)
-        
     def add_mountain_before(self, mountain: Mountain) -> TrailStore:
         """
         Returns a *new* trail which would be the result of:
@@ -86,8 +93,8 @@ class TrailSeries:
 
 TrailStore = Union[TrailSplit, TrailSeries, None]
 
-@dataclass
-class Trail:
+@dataclass(slots=True)
+class Trail(_TrailNode):
 
     store: TrailStore = None
 
@@ -145,108 +152,225 @@ class Trail:
 
         from personality import PersonalityDecision
 
+        # Enum members are singletons, so decisions are matched with `is` against these locals.
+        TOP = PersonalityDecision.TOP
+        BOTTOM = PersonalityDecision.BOTTOM
+        STOP = PersonalityDecision.STOP
+
+        # Bound once, rather than looked up on the personality at every mountain and split.
+        add_mountain = personality.add_mountain
+        select_branch = personality.select_branch
+
         #st
         store = self.store
 
-        before_splitting = linked_stack.LinkedStack()
+        # A plain list as the stack: append/pop run in C, with no node allocated per push.
+        before_splitting = []
 
         # Complexity: O(n) (where 'n' is the number of elements along the path)
         while True:
 
             # Complexity: O(1)
             if store is None:
-                if before_splitting.is_empty():
+                if not before_splitting:
                     break
                 # Complexity: O(1)
                 store = before_splitting.pop()
 
+            # Exact type checks are a pointer comparison, with no subclass (MRO) walk like isinstance.
+            store_type = type(store)
+
             # Complexity: O(1)
-            if isinstance(store, TrailSeries):
+            if store_type is TrailSeries:
                 # Complexity: O(1)
-                personality.add_mountain(store.mountain)
+                add_mountain(store.mountain)
                 # Complexity: O(1)
                 store = store.following.store
 
             # Complexity: O(1)
-            elif isinstance(store, TrailSplit):
-                # Complexity: O(1)
-                personality_decision = personality.select_branch(Trail(store.top.store), Trail(store.bottom.store))
-                # Complexity: O(1)
-                before_splitting.push(store.following.store)
+            elif store_type is TrailSplit:
                 top_branch = store.top
                 bottom_branch = store.bottom
+                # The branches are already Trails, so they are passed as they are rather than re-wrapped.
+                # Personalities only read the branches they are shown.
+                # Complexity: O(1)
+                personality_decision = select_branch(top_branch, bottom_branch)
+                # Complexity: O(1)
+                before_splitting.append(store.following.store)
+
+                # A decision from a second import of personality (e.g. run as __main__) is a different
+                # object, so it is mapped back here once, relying on BaseEnum.__eq__ comparing name and value.
+                if personality_decision is not TOP and personality_decision is not BOTTOM and personality_decision is not STOP:
+                    for decision in (TOP, BOTTOM, STOP):
+                        if personality_decision == decision:
+                            personality_decision = decision
 
                 # Complexity: O(1)
-                if personality_decision == PersonalityDecision.TOP:
+                if personality_decision is TOP:
                     # Complexity: O(1)
                     store = top_branch.store
                 # Complexity: O(1)
-                elif personality_decision == PersonalityDecision.BOTTOM:
+                elif personality_decision is BOTTOM:
                     # Complexity: O(1)
                     store = bottom_branch.store
                 # Complexity: O(1)
-                elif personality_decision == PersonalityDecision.STOP:
+                elif personality_decision is STOP:
                     # Complexity: O(1)
                     break
 
-    def collect_all_mountains(self) -> list[Mountain]:
-        """Returns a list of all mountains on the trail."""
+    def iter_mountains(self) -> Iterator[Mountain]:
+        """
+        Yields every mountain on the trail, without building a list first.
+
+        Walks the trail with an explicit stack, so callers that only scan the mountains
+        (e.g. to pass them straight to MountainOrganiser.add_mountains) never pay for materialising them.
+        """
 
-        mountains_list = []  # Initialize a list to store the mountains
-        stack = linked_stack.LinkedStack()  # Create a stack to traverse the trail
-        stack.push(self.store)  # Start from the root of the trail
+        stack = [self.store]  # Create a stack to traverse the trail, starting from the root of the trail
 
-        while not stack.is_empty():  # Continue until the stack is empty
+        while stack:  # Continue until the stack is empty
             item = stack.pop()  # Pop the top item from the stack
-            if isinstance(item, TrailSeries):
-                # If the item is a TrailSeries, add its mountain to the list
-                mountains_list.append(item.mountain)
-                # Push the following trail onto the stack for further exploration
-                stack.push(item.following.store)
-            elif isinstance(item, TrailSplit):
+            # Walk a run of TrailSeries in place, so the stack is only used at splits
+            while type(item) is TrailSeries:
+                yield item.mountain
+                item = item.following.store
+            if type(item) is TrailSplit:
                 # If the item is a TrailSplit, push the top and bottom branches
-                stack.push(item.top.store)
-                stack.push(item.bottom.store)
+                stack.append(item.top.store)
+                stack.append(item.bottom.store)
                 # Push the following trail onto the stack for further exploration
-                stack.push(item.following.store)
+                stack.append(item.following.store)
+
+    def collect_all_mountains(self) -> list[Mountain]:
+        """Returns a list of all mountains on the trail."""
+        return list(self.iter_mountains())
+
+    def _live_branches(self, max_difficulty: int) -> dict[int, tuple[bool, bool] | None] | None:
+        """
+        Memoises, for every split on the trail, which of its branches can still produce a path under max_difficulty.
+
+        Maps id(split) to (top is live, bottom is live), or to None when no path through the split survives,
+        because its following trail or both of its branches always hit a mountain over the limit.
+        Returns None instead of the map when no path through the whole trail survives.
+        Splits are found in pre-order and evaluated in reverse, so every split nested inside one is evaluated first,
+        and each split is evaluated once however many paths reach it.
+        Splits are keyed by id() as they are dataclasses with eq, so unhashable. This is only safe within one call.
 
-        return mountains_list  # Return the list of mountains
+        :complexity: O(N) where N is the number of stores on the trail.
+        """
+
+        splits = []
+        stack = [self.store]
+        while stack:
+            item = stack.pop()
+            while type(item) is TrailSeries:
+                item = item.following.store
+            if type(item) is TrailSplit:
+                splits.append(item)
+                stack.append(item.top.store)
+                stack.append(item.bottom.store)
+                stack.append(item.following.store)
+
+        live = {}
+
+        def is_live(store: TrailStore) -> bool:
+            # Walk the run of mountains, then look up the split it ends at (already evaluated).
+            while type(store) is TrailSeries:
+                if store.mountain.difficulty_level > max_difficulty:
+                    return False
+                store = store.following.store
+            return store is None or live[id(store)] is not None
 
-    def difficulty_maximum_paths(self, max_difficulty: int) -> list[list[Mountain]]:
-        """Calculates paths through the trail with a maximum difficulty level."""
+        for split in reversed(splits):
+            branches = None
+            if is_live(split.following.store):
+                top_live = is_live(split.top.store)
+                bottom_live = is_live(split.bottom.store)
+                if top_live or bottom_live:
+                    branches = (top_live, bottom_live)
+            live[id(split)] = branches
+
+        return live if is_live(self.store) else None
+
+    def difficulty_maximum_paths(self, max_difficulty: int, max_paths: int | None = None) -> list[list[Mountain]]:
+        """
+        Calculates paths through the trail with a maximum difficulty level.
+
+        If max_paths is given, the search stops as soon as that many paths have been found, so the
+        result is the first max_paths paths of the full result, in the same order.
+
+        An explicit depth-first search: `work` holds the bottom branches still to explore, each as
+        (store, length of ind_path at the split, following trails). Top branches are followed straight
+        away, so paths come out in the same top-before-bottom order as a recursive search.
+        The following trails are a linked list of (store, rest) tuples, shared between frames and never
+        modified, so going back to a split only needs ind_path cut back to its recorded length.
+        Branches that `_live_branches` has found cannot produce a path are never entered, so the
+        search does not repeat a dead end once for every path that reaches it. Every mountain on a
+        live branch is within the limit, so once the whole trail is known to be live no mountain
+        needs checking again and no path is started only to be dropped.
+        """
+
+        if max_paths is not None and max_paths <= 0:
+            return []
+
+        live = self._live_branches(max_difficulty)
+        if live is None:
+            return []
 
         all_store_paths = []  # Initialize a list to store all valid paths
         ind_path = []  # Initialize an individual path list
-        follow_path_list = []  # Initialize a list for tracking the following paths
-        self.difficulty_maximum_auxiliary(self.store, max_difficulty, all_store_paths, ind_path, follow_path_list)
-        return all_store_paths  # Return the list of paths
+        work = [(self.store, 0, None)]
+
+        while work:
+            current_store, path_length, follow_paths = work.pop()
+            del ind_path[path_length:]
+
+            while True:
+                store_type = type(current_store)
+                if store_type is TrailSeries:
+                    # Live branches were checked against the limit by _live_branches
+                    ind_path.append(current_store.mountain)
+                    current_store = current_store.following.store
+                elif store_type is TrailSplit:
+                    # Only live branches are entered, so this split is live too.
+                    top_live, bottom_live = live[id(current_store)]
+                    # Explore the top branch now and the bottom branch later, both continuing with the following trail
+                    follow_paths = (current_store.following.store, follow_paths)
+                    if bottom_live:
+                        work.append((current_store.bottom.store, len(ind_path), follow_paths))
+                    if not top_live:
+                        break
+                    current_store = current_store.top.store
+                elif follow_paths is not None:
+                    # If the current store's following is None, we backtrack
+                    current_store, follow_paths = follow_paths
+                else:
+                    # We have reached the end of a path, add a copy of it to the list of valid paths
+                    all_store_paths.append(ind_path[:])
+                    if len(all_store_paths) == max_paths:
+                        return all_store_paths
+                    break
 
-    def difficulty_maximum_auxiliary(self, current_store: TrailStore, max_difficulty, all_store_paths, ind_path, follow_path_list):
-        """Auxiliary function to calculate paths with a maximum difficulty level."""
-
-        if isinstance(current_store, TrailSplit):
-            # If the current store is a TrailSplit, explore both top and bottom branches
-            self.difficulty_maximum_auxiliary(current_store.top.store, max_difficulty, all_store_paths, ind_path[:], follow_path_list + [current_store.following.store])
-            self.difficulty_maximum_auxiliary(current_store.bottom.store, max_difficulty, all_store_paths, ind_path[:], follow_path_list + [current_store.following.store])
-        elif isinstance(current_store, TrailSeries):
-            # If the current store is a TrailSeries, check if the mountain's difficulty is within the limit
-            if current_store.mountain.difficulty_level <= max_difficulty:
-                ind_path.append(current_store.mountain)
-                self.difficulty_maximum_auxiliary(current_store.following.store, max_difficulty, all_store_paths, ind_path, follow_path_list)
-            else:
-                ind_path.clear()
-        else:
-            # If the current store's following is None, we backtrack
-            if not len(follow_path_list) == 0:
-                current_store = follow_path_list.pop()
-                self.difficulty_maximum_auxiliary(current_store, max_difficulty, all_store_paths, ind_path, follow_path_list)
-            else:
-                # We have reached the end of a path, add it to the list of valid paths
-                all_store_paths.append(ind_path)
+        return all_store_paths  # Return the list of paths
 
     def difficulty_difference_paths(self, max_difference: int) -> list[list[Mountain]]: # Input to this should not exceed k > 50, at most 5 branches.
         # 1054 ONLY!
         raise NotImplementedError()
 
-if __name__ == "__name__":
-    ...
\ No newline at end of file
+if __name__ == "__main__":
+    # Small driver for timing the traversals from the command line: python trail.py
+    from timeit import timeit
+
+    # A trail of nested splits, each with a short series on the top branch.
+    trail = Trail(None)
+    for i in range(12):
+        trail = Trail(TrailSplit(
+            Trail(TrailSeries(Mountain(f"top-{i}", i % 7, 1), Trail(TrailSeries(Mountain(f"mid-{i}", 3, 1), Trail(None))))),
+            Trail(None),
+            trail,
+        ))
+
+    print("mountains:", len(trail.collect_all_mountains()))
+    print("paths (<= 5):", len(trail.difficulty_maximum_paths(5)))
+    print(f"collect_all_mountains: {timeit(trail.collect_all_mountains, number=1000):.4f}s / 1000")
+    print(f"difficulty_maximum_paths(5): {timeit(lambda: trail.difficulty_maximum_paths(5), number=10):.4f}s / 10")